@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
 from huntd.git import Commit, FileChange, RepoInfo
@@ -40,14 +42,14 @@ class RepoRanking:
 
 @dataclass
 class LanguageEvolution:
-    monthly: dict[str, dict[str, int]] = field(default_factory=dict)
-    top_languages: list[str] = field(default_factory=list)
+    monthly: dict[str, dict[str, int]] = field(default_factory=dict)  # oldest month first
+    top_languages: list[str] = field(default_factory=list)            # most lines first
 
 
 @dataclass
 class CodeVelocity:
-    commits_by_week: dict[str, int] = field(default_factory=dict)
-    lines_by_week: dict[str, int] = field(default_factory=dict)
+    commits_by_week: dict[str, int] = field(default_factory=dict)  # oldest ISO week first
+    lines_by_week: dict[str, int] = field(default_factory=dict)    # same key order
     trend: str = "stable"
     peak_week: str = ""
     peak_commits: int = 0
@@ -85,18 +87,31 @@ class Analytics:
     total_languages: int = 0
     streaks: Streaks = field(default_factory=Streaks)
     heatmap: list[list[int]] = field(default_factory=list)  # 7 rows x N cols
-    languages: dict[str, int] = field(default_factory=dict)
-    repo_rankings: list[RepoRanking] = field(default_factory=list)
+    languages: dict[str, int] = field(default_factory=dict)          # most lines first
+    repo_rankings: list[RepoRanking] = field(default_factory=list)  # most commits first
     activity: ActivityPattern = field(default_factory=ActivityPattern)
     language_evolution: LanguageEvolution = field(default_factory=LanguageEvolution)
     code_velocity: CodeVelocity = field(default_factory=CodeVelocity)
     focus_score: FocusScore = field(default_factory=FocusScore)
     workday_split: WorkdaySplit = field(default_factory=WorkdaySplit)
-    file_hotspots: list[FileHotspot] = field(default_factory=list)
+    file_hotspots: list[FileHotspot] = field(default_factory=list)  # most churn first
 
 
 DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
+
+@lru_cache(maxsize=24)
+def format_hour(h: int) -> str:
+    """Format a 0-23 hour as a 12-hour clock string, e.g. 0 → "12am"."""
+    if h == 0:
+        return "12am"
+    if h < 12:
+        return f"{h}am"
+    if h == 12:
+        return "12pm"
+    return f"{h - 12}pm"
+
+
 # File extensions to readable language names
 EXT_MAP = {
     ".py": "Python", ".js": "JavaScript", ".ts": "TypeScript",
@@ -117,37 +132,32 @@ EXT_MAP = {
 }
 
 
+def _local_date(ts: datetime) -> date:
+    """Calendar date of a commit timestamp in local time."""
+    return ts.astimezone().date() if ts.tzinfo else ts.date()
+
+
+def _commit_day_counts(all_commits: list[Commit]) -> Counter[date]:
+    """Commits per local calendar day."""
+    return Counter(_local_date(c.timestamp) for c in all_commits)
+
+
 def compute_streaks(all_commits: list[Commit]) -> Streaks:
     """Compute current and longest coding streaks from commit dates."""
     if not all_commits:
         return Streaks()
 
-    # Get unique dates (in local time)
-    dates: set[date] = set()
-    for c in all_commits:
-        if c.timestamp.tzinfo:
-            d = c.timestamp.astimezone().date()
-        else:
-            d = c.timestamp.date()
-        dates.add(d)
-
-    if not dates:
-        return Streaks()
-
-    sorted_dates = sorted(dates)
+    counts = _commit_day_counts(all_commits)
+    dates = counts.keys()
     today = date.today()
+    today_commits = counts.get(today, 0)
 
-    # Count today's commits
-    today_commits = sum(
-        1 for c in all_commits
-        if (c.timestamp.astimezone().date() if c.timestamp.tzinfo else c.timestamp.date()) == today
-    )
-
-    # Compute longest streak
+    # Compute longest streak over the sorted day ordinals
+    ordinals = sorted(d.toordinal() for d in dates)
     longest = 1
     current_run = 1
-    for i in range(1, len(sorted_dates)):
-        if sorted_dates[i] - sorted_dates[i - 1] == timedelta(days=1):
+    for prev, cur in zip(ordinals, ordinals[1:]):
+        if cur - prev == 1:
             current_run += 1
             longest = max(longest, current_run)
         else:
@@ -176,32 +186,33 @@ def compute_heatmap(all_commits: list[Commit], weeks: int = 52) -> list[list[int
     # Align to start of the week (Monday)
     start = today - timedelta(days=today.weekday(), weeks=weeks - 1)
 
-    # Count commits per date
-    counts: Counter[date] = Counter()
-    for c in all_commits:
-        d = c.timestamp.astimezone().date() if c.timestamp.tzinfo else c.timestamp.date()
-        counts[d] += 1
-
-    # Build matrix
-    matrix = [[0] * weeks for _ in range(7)]
-    for week in range(weeks):
-        for dow in range(7):
-            day = start + timedelta(weeks=week, days=dow)
-            if day <= today:
-                matrix[dow][week] = counts.get(day, 0)
+    # Place each active day by its offset from `start`; only days that have
+    # commits are visited instead of every cell of the grid. Cells live in
+    # one flat row-major list and are split into rows on the way out.
+    cells = [0] * (7 * weeks)
+    horizon = (today - start).days
+    for day, n in _commit_day_counts(all_commits).items():
+        offset = (day - start).days
+        if 0 <= offset <= horizon:
+            week, dow = divmod(offset, 7)
+            cells[dow * weeks + week] = n
 
-    return matrix
+    return [cells[row:row + weeks] for row in range(0, 7 * weeks, weeks)]
 
 
 def compute_languages(all_file_changes: list[FileChange]) -> dict[str, int]:
     """Aggregate lines changed by language (file extension)."""
     ext_counts: Counter[str] = Counter()
     for fc in all_file_changes:
-        lang = EXT_MAP.get(fc.ext, fc.ext)
-        ext_counts[lang] += fc.added + fc.removed
+        ext_counts[fc.ext] += fc.added + fc.removed
+
+    # Resolve each distinct extension to its language once
+    lang_counts: Counter[str] = Counter()
+    for ext, lines in ext_counts.items():
+        lang_counts[EXT_MAP.get(ext, ext)] += lines
 
     # Sort by lines changed, descending
-    return dict(ext_counts.most_common())
+    return dict(lang_counts.most_common())
 
 
 def compute_repo_rankings(repos: list[RepoInfo]) -> list[RepoRanking]:
@@ -242,24 +253,19 @@ def compute_activity_patterns(all_commits: list[Commit]) -> ActivityPattern:
     by_hour = [0] * 24
     by_dow = [0] * 7
 
+    first = date.max
     for c in all_commits:
         local = c.timestamp.astimezone() if c.timestamp.tzinfo else c.timestamp
         by_hour[local.hour] += 1
         by_dow[local.weekday()] += 1
+        first = min(first, local.date())
 
     busiest_hour = by_hour.index(max(by_hour))
     busiest_dow = by_dow.index(max(by_dow))
 
     # Average commits per day (from first commit to today)
-    dates = set()
-    for c in all_commits:
-        d = c.timestamp.astimezone().date() if c.timestamp.tzinfo else c.timestamp.date()
-        dates.add(d)
-    if dates:
-        span = (date.today() - min(dates)).days or 1
-        avg = len(all_commits) / span
-    else:
-        avg = 0
+    span = (date.today() - first).days or 1
+    avg = len(all_commits) / span
 
     return ActivityPattern(
         busiest_day=DAYS[busiest_dow],
@@ -465,21 +471,27 @@ def compute_file_hotspots(repos: list[RepoInfo], top_n: int = 15) -> list[FileHo
     touch_map: dict[str, set[str]] = defaultdict(set)
 
     for repo in repos:
+        # Group by bare path first so the "repo/path" key is built once per file
+        repo_churn: dict[str, int] = defaultdict(int)
+        repo_touches: dict[str, set[str]] = defaultdict(set)
         for fc in repo.file_changes:
-            full_path = f"{repo.name}/{fc.path}"
-            churn_map[full_path] += fc.added + fc.removed
-            touch_map[full_path].add(fc.hash)
+            repo_churn[fc.path] += fc.added + fc.removed
+            repo_touches[fc.path].add(fc.hash)
+        for path, churn in repo_churn.items():
+            full_path = f"{repo.name}/{path}"
+            churn_map[full_path] += churn
+            touch_map[full_path] |= repo_touches[path]
 
-    hotspots = [
-        FileHotspot(path=p, churn=churn, touches=len(touch_map[p]))
-        for p, churn in churn_map.items()
-    ]
-    hotspots.sort(key=lambda h: h.churn, reverse=True)
-    return hotspots[:top_n]
+    top = heapq.nlargest(top_n, churn_map.items(), key=lambda item: item[1])
+    return [FileHotspot(path=p, churn=churn, touches=len(touch_map[p])) for p, churn in top]
 
 
 def build_analytics(repos: list[RepoInfo]) -> Analytics:
-    """Build full analytics from a list of scanned repos."""
+    """Build full analytics from a list of scanned repos.
+
+    Every ranked collection comes out already ordered (see the field
+    comments on Analytics), so renderers can slice without re-sorting.
+    """
     all_commits: list[Commit] = []
     all_file_changes: list[FileChange] = []
     for repo in repos:
@@ -5,12 +5,11 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from huntd import __version__
 from huntd.achievements import compute_achievements
-from huntd.analytics import DAYS, build_analytics
-from huntd.git import RepoInfo, scan_repo
+from huntd.analytics import DAYS, build_analytics, format_hour
+from huntd.git import RepoInfo, scan_repos
 from huntd.scanner import find_repos
 
 
@@ -28,35 +27,18 @@ def _scan_all(
 
     print(f"  Found {len(repo_paths)} repos. Scanning...", file=sys.stderr)
 
-    repos: list[RepoInfo] = []
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        futures = {
-            executor.submit(scan_repo, p, since=since, until=until, author=author): p
-            for p in repo_paths
-        }
-        for i, future in enumerate(as_completed(futures), 1):
-            try:
-                repos.append(future.result())
-            except Exception:
-                pass
-            name = futures[future].split("/")[-1]
-            print(f"\r  [{i}/{len(repo_paths)}] {name:<30}", end="", file=sys.stderr)
+    def _progress(i: int, path: str) -> None:
+        name = path.split("/")[-1]
+        print(f"\r  [{i}/{len(repo_paths)}] {name:<30}", end="", file=sys.stderr)
+
+    repos = scan_repos(
+        repo_paths, since=since, until=until, author=author, on_progress=_progress,
+    )
 
     print(file=sys.stderr)
     return repos
 
 
-def _format_hour(h: int) -> str:
-    """Format 24h hour as readable string."""
-    if h == 0:
-        return "12am"
-    if h < 12:
-        return f"{h}am"
-    if h == 12:
-        return "12pm"
-    return f"{h - 12}pm"
-
-
 def _filter_label(
     since: str | None,
     until: str | None,
@@ -126,7 +108,7 @@ def print_summary(
     analytics = build_analytics(repos)
     s = analytics.streaks
     a = analytics.activity
-    hour = _format_hour(a.busiest_hour)
+    hour = format_hour(a.busiest_hour)
 
     # Overview panel
     overview = Text()
@@ -255,7 +237,7 @@ def print_summary(
     le = analytics.language_evolution
     if le.monthly and le.top_languages:
         console.print(Rule(f"[bold {PURPLE}]📈 Language Evolution[/bold {PURPLE}]", style=PURPLE))
-        last_6_keys = sorted(le.monthly.keys())[-6:]
+        last_6_keys = list(le.monthly)[-6:]
         evo_table = Table(border_style=SURFACE, show_edge=True, pad_edge=True)
         evo_table.add_column("Language", style=f"bold {CYAN}")
         for mk in last_6_keys:
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import date
 
 from huntd.achievements import compute_achievements
-from huntd.analytics import Analytics
+from huntd.analytics import Analytics, format_hour
 from huntd.theme import BG, CYAN, GREEN, MUTED, PURPLE, RED, SURFACE, YELLOW
 
 
@@ -24,14 +24,7 @@ def generate_wrapped_svg(analytics: Analytics) -> str:
     unlocked = [b for b in badges if b.unlocked]
     badge_text = ", ".join(b.name for b in unlocked[:5]) if unlocked else "None yet"
 
-    if a.busiest_hour == 0:
-        hour = "12am"
-    elif a.busiest_hour < 12:
-        hour = f"{a.busiest_hour}am"
-    elif a.busiest_hour == 12:
-        hour = "12pm"
-    else:
-        hour = f"{a.busiest_hour - 12}pm"
+    hour = format_hour(a.busiest_hour)
 
     year = date.today().year
 
@@ -152,14 +145,7 @@ def generate_report_md(analytics: Analytics) -> str:
 
     top_lang = next(iter(analytics.languages), "—")
 
-    if a.busiest_hour == 0:
-        hour = "12am"
-    elif a.busiest_hour < 12:
-        hour = f"{a.busiest_hour}am"
-    elif a.busiest_hour == 12:
-        hour = "12pm"
-    else:
-        hour = f"{a.busiest_hour - 12}pm"
+    hour = format_hour(a.busiest_hour)
 
     year = date.today().year
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import re
 import subprocess
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -50,9 +53,14 @@ class RepoInfo:
 
 def _run_git(repo_path: str, args: list[str], timeout: int = 60) -> str:
     """Run a git command and return stdout."""
+    # A missing directory can never be a repo — don't pay a git launch to find out
+    if not os.path.isdir(repo_path):
+        return ""
     try:
         result = subprocess.run(
-            ["git", "-C", repo_path] + args,
+            # Read-only scans must not take index locks the user's own git may want
+            ["git", "--no-optional-locks", "-C", repo_path] + args,
+            stdin=subprocess.DEVNULL,  # never let git read the user's terminal
             capture_output=True,
             text=True,
             timeout=timeout,
@@ -79,6 +87,18 @@ def _filter_args(
     return extra
 
 
+def _split_commit_block(block: str) -> tuple[list[str], list[str]] | None:
+    """Split one COMMIT_SEP block into its 5 header lines and the stat lines after.
+
+    Header fields are taken by position before any blank lines are dropped,
+    so an empty subject doesn't shift the stat lines into the header.
+    """
+    lines = block.lstrip("\n").split("\n")
+    if len(lines) < 5 or not lines[0].strip():
+        return None
+    return lines[:5], [ln for ln in lines[5:] if ln.strip()]
+
+
 def get_commits(
     repo_path: str,
     *,
@@ -100,25 +120,26 @@ def get_commits(
     blocks = output.split(marker)
 
     for block in blocks:
-        lines = [ln for ln in block.strip().split("\n") if ln.strip()]
-        if len(lines) < 5:
+        parsed = _split_commit_block(block)
+        if parsed is None:
             continue
+        header, stat_lines = parsed
 
         try:
-            ts = datetime.fromisoformat(lines[3])
-        except (ValueError, IndexError):
+            ts = datetime.fromisoformat(header[3])
+        except ValueError:
             continue
 
         commit = Commit(
-            hash=lines[0],
-            author=lines[1],
-            email=lines[2],
+            hash=header[0],
+            author=header[1],
+            email=header[2],
             timestamp=ts,
-            subject=lines[4],
+            subject=header[4],
         )
 
         # Parse --shortstat line if present
-        for line in lines[5:]:
+        for line in stat_lines:
             if "changed" in line:
                 ins = re.search(r"(\d+) insertion", line)
                 dels = re.search(r"(\d+) deletion", line)
@@ -192,8 +213,95 @@ def get_file_stats(
     return changes
 
 
-def get_repo_info(repo_path: str) -> RepoInfo:
-    """Get basic repo metadata (fast — small individual calls)."""
+def get_commits_and_files(
+    repo_path: str,
+    *,
+    since: str | None = None,
+    until: str | None = None,
+    author: str | None = None,
+) -> tuple[list[Commit], list[FileChange]]:
+    """Extract commits and per-file changes from one `git log --numstat` call.
+
+    Equivalent to get_commits() + get_file_stats(), but walks history once;
+    commit totals are summed from the numstat lines instead of --shortstat.
+    """
+    marker = COMMIT_SEP
+    fmt = f"{marker}%n%H%n%an%n%ae%n%aI%n%s"
+    output = _run_git(repo_path, [
+        "log", "--all", f"--pretty=format:{fmt}", "--numstat",
+    ] + _filter_args(since, until, author))
+    if not output.strip():
+        return [], []
+
+    commits: list[Commit] = []
+    changes: list[FileChange] = []
+
+    for block in output.split(marker):
+        parsed = _split_commit_block(block)
+        if parsed is None:
+            continue
+        header, stat_lines = parsed
+
+        try:
+            ts = datetime.fromisoformat(header[3])
+        except ValueError:
+            continue
+
+        commit = Commit(
+            hash=header[0],
+            author=header[1],
+            email=header[2],
+            timestamp=ts,
+            subject=header[4],
+        )
+
+        # numstat lines: <added>\t<removed>\t<filepath>
+        for line in stat_lines:
+            tabs = line.strip().split("\t")
+            if len(tabs) != 3:
+                continue
+            added_str, removed_str, filepath = tabs
+            commit.files_changed += 1
+            # Binary files show "-" for added/removed
+            if added_str == "-" or removed_str == "-":
+                continue
+            try:
+                added = int(added_str)
+                removed = int(removed_str)
+            except ValueError:
+                continue
+            commit.insertions += added
+            commit.deletions += removed
+            ext = Path(filepath).suffix.lower() or "(no ext)"
+            changes.append(FileChange(
+                hash=commit.hash,
+                timestamp=ts,
+                path=filepath,
+                ext=ext,
+                added=added,
+                removed=removed,
+            ))
+
+        commits.append(commit)
+
+    return commits, changes
+
+
+def _count_commits(repo_path: str) -> int:
+    """Commit count across all refs, or 0 if git fails."""
+    count_out = _run_git(repo_path, ["rev-list", "--count", "--all"])
+    try:
+        return int(count_out.strip())
+    except ValueError:
+        return 0
+
+
+def get_repo_info(repo_path: str, *, count_commits: bool = True) -> RepoInfo:
+    """Get basic repo metadata (fast — small individual calls).
+
+    Pass count_commits=False to skip the rev-list call when the caller
+    already knows the total.
+    """
     name = Path(repo_path).name
     info = RepoInfo(path=repo_path, name=name)
 
@@ -216,12 +324,8 @@ def get_repo_info(repo_path: str) -> RepoInfo:
         info.has_readme = any("readme" in f.lower() for f in tree_out.strip().split("\n"))
 
     # Total commit count
-    count_out = _run_git(repo_path, ["rev-list", "--count", "--all"])
-    if count_out.strip():
-        try:
-            info.total_commits = int(count_out.strip())
-        except ValueError:
-            pass
+    if count_commits:
+        info.total_commits = _count_commits(repo_path)
 
     # Dirty check
     status_out = _run_git(repo_path, ["status", "--porcelain"], timeout=10)
@@ -238,7 +342,48 @@ def scan_repo(
     author: str | None = None,
 ) -> RepoInfo:
     """Full scan of a single repo — returns RepoInfo with commits and file changes."""
-    info = get_repo_info(repo_path)
-    info.commits = get_commits(repo_path, since=since, until=until, author=author)
-    info.file_changes = get_file_stats(repo_path, since=since, until=until, author=author)
+    # Unfiltered, the log already covers every commit — no need to count separately
+    filtered = bool(since or until or author)
+    info = get_repo_info(repo_path, count_commits=filtered)
+    info.commits, info.file_changes = get_commits_and_files(
+        repo_path, since=since, until=until, author=author,
+    )
+    if not filtered:
+        info.total_commits = len(info.commits)
+        # An empty log on a repo with history means the log failed (e.g. timed
+        # out) — fall back to the cheap count so health scoring stays right
+        if not info.commits and info.last_commit is not None:
+            info.total_commits = _count_commits(repo_path)
     return info
+
+
+def scan_repos(
+    repo_paths: list[str],
+    *,
+    since: str | None = None,
+    until: str | None = None,
+    author: str | None = None,
+    workers: int = 8,
+    on_progress: Callable[[int, str], None] | None = None,
+) -> list[RepoInfo]:
+    """Scan many repos in parallel, returning results in input order.
+
+    Threads suffice: each scan spends its time waiting on git subprocesses.
+    Repos whose scan raises are skipped. `on_progress(done, path)` is called
+    as each scan finishes.
+    """
+    results: dict[str, RepoInfo] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(scan_repo, p, since=since, until=until, author=author): p
+            for p in repo_paths
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            path = futures[future]
+            try:
+                results[path] = future.result()
+            except Exception:
+                pass
+            if on_progress:
+                on_progress(i, path)
+    return [results[p] for p in repo_paths if p in results]
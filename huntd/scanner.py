@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from pathlib import Path
+from collections.abc import Iterator
 
 SKIP_DIRS = frozenset({
     "node_modules", ".venv", "venv", "__pycache__", "target", "build",
@@ -13,47 +13,57 @@ SKIP_DIRS = frozenset({
 })
 
 
-def find_repos(root: str, max_depth: int = 6) -> list[str]:
-    """Recursively find all git repository paths under root.
+def find_repos_iter(root: str, max_depth: int = 6) -> Iterator[str]:
+    """Yield git repository paths under root as the walk discovers them.
 
-    Returns a sorted list of absolute paths to directories containing .git.
+    Paths come out in walk order, not sorted — use find_repos() for a list.
     """
     root = os.path.expanduser(root)
     root = os.path.abspath(root)
-    repos: list[str] = []
 
-    def _walk(path: str, depth: int) -> None:
-        if depth > max_depth:
-            return
+    # Explicit depth-first stack: no generator chain per directory level
+    stack: list[tuple[str, int]] = [(root, 0)]
+    while stack:
+        path, depth = stack.pop()
         try:
-            entries = list(os.scandir(path))
+            with os.scandir(path) as it:
+                entries = list(it)
         except (PermissionError, OSError):
-            return
+            continue
 
         has_git = False
-        subdirs: list[os.DirEntry] = []
+        subdirs: list[str] = []
 
         for entry in entries:
+            name = entry.name
             try:
-                if entry.name == ".git" and entry.is_dir(follow_symlinks=False):
-                    has_git = True
-                elif entry.is_dir(follow_symlinks=False):
-                    subdirs.append(entry)
+                if name == ".git":
+                    if entry.is_dir(follow_symlinks=False):
+                        has_git = True
+                        break
+                # Prune hidden and skipped dirs before asking for file type
+                elif (
+                    not name.startswith(".")
+                    and name not in SKIP_DIRS
+                    and entry.is_dir(follow_symlinks=False)
+                ):
+                    subdirs.append(entry.path)
             except (PermissionError, OSError):
                 continue
 
         if has_git:
-            repos.append(path)
+            yield path
             # Don't recurse into a found repo — avoids submodule noise
-            return
+            continue
+
+        if depth < max_depth:
+            # Reversed so pops visit subdirs in scandir order, as recursion did
+            stack.extend((d, depth + 1) for d in reversed(subdirs))
 
-        for d in subdirs:
-            if d.name.startswith("."):
-                continue
-            if d.name in SKIP_DIRS:
-                continue
-            _walk(d.path, depth + 1)
 
-    _walk(root, 0)
-    repos.sort()
-    return repos
+def find_repos(root: str, max_depth: int = 6) -> list[str]:
+    """Recursively find all git repository paths under root.
+
+    Returns a sorted list of absolute paths to directories containing .git.
+    """
+    return sorted(find_repos_iter(root, max_depth))
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+
 from rich.style import Style
 from rich.text import Text
 
@@ -144,34 +146,43 @@ def health_color(score: int) -> str:
 
 # ── Heatmap Rendering ──────────────────────────────────────────────────
 
+# Upper bound (inclusive) of each heat level below the hottest one
+HEAT_THRESHOLDS = (0, 2, 5, 9)
+HEAT_CHARS = "░▒▓██"
+_HEAT_STYLES = tuple(Style(color=c) for c in HEAT_COLORS)
+_DAY_LABELS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
 def heatmap_block(count: int) -> tuple[str, str]:
     """Return (character, color) for a heatmap cell based on commit count."""
-    if count == 0:
-        return "░", HEAT_COLORS[0]
-    if count <= 2:
-        return "▒", HEAT_COLORS[1]
-    if count <= 5:
-        return "▓", HEAT_COLORS[2]
-    if count <= 9:
-        return "█", HEAT_COLORS[3]
-    return "█", HEAT_COLORS[4]
+    level = bisect_left(HEAT_THRESHOLDS, count)
+    return HEAT_CHARS[level], HEAT_COLORS[level]
 
 
 def render_heatmap(matrix: list[list[int]], day_labels: bool = True) -> Text:
     """Render a 7×N heatmap matrix as Rich Text with GitHub green colors.
 
     matrix: 7 rows (Mon-Sun) × N cols (weeks, newest on right).
+    Consecutive cells at the same heat level are emitted as a single span.
     """
-    days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    label_style = Style(color=MUTED)
     text = Text()
 
     for row_idx, row in enumerate(matrix):
         if day_labels:
-            text.append(f" {days[row_idx]} ", style=Style(color=MUTED))
+            text.append(f" {_DAY_LABELS[row_idx]} ", style=label_style)
 
+        run_level = -1
+        run_len = 0
         for count in row:
-            char, color = heatmap_block(count)
-            text.append(char, style=Style(color=color))
+            level = bisect_left(HEAT_THRESHOLDS, count)
+            if level != run_level:
+                if run_len:
+                    text.append(HEAT_CHARS[run_level] * run_len, style=_HEAT_STYLES[run_level])
+                run_level, run_len = level, 0
+            run_len += 1
+        if run_len:
+            text.append(HEAT_CHARS[run_level] * run_len, style=_HEAT_STYLES[run_level])
 
         text.append("\n")
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
@@ -10,13 +11,14 @@ from rich.text import Text
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
+from textual.widget import Widget
 from textual.widgets import DataTable, Footer, Header, Label, LoadingIndicator, Static
 from textual_plotext import PlotextPlot
 
 from huntd.achievements import compute_achievements
-from huntd.analytics import Analytics, build_analytics
+from huntd.analytics import Analytics, build_analytics, format_hour
 from huntd.git import RepoInfo, scan_repo
-from huntd.scanner import find_repos
+from huntd.scanner import find_repos_iter
 from huntd.theme import (
     ACCENT_ACTIVITY,
     ACCENT_HEATMAP,
@@ -41,6 +43,31 @@ from huntd.theme import (
 )
 
 
+# Cell styles shared by the table panels — built once, reused for every row
+_STYLE_CYAN = Style(color=CYAN)
+_STYLE_CYAN_BOLD = Style(color=CYAN, bold=True)
+_STYLE_GREEN = Style(color=GREEN)
+_STYLE_GREEN_BOLD = Style(color=GREEN, bold=True)
+_STYLE_YELLOW = Style(color=YELLOW)
+_STYLE_RED = Style(color=RED)
+_STYLE_RED_BOLD = Style(color=RED, bold=True)
+
+# Plot palettes (RGB) — immutable, so they're shared across refreshes
+_LANG_BAR_COLORS = (
+    (57, 211, 83),    # green
+    (88, 166, 255),   # cyan
+    (188, 140, 255),  # purple
+    (227, 179, 65),   # yellow
+) * 2
+_LANG_EVO_COLORS = (
+    (57, 211, 83), (88, 166, 255), (188, 140, 255), (227, 179, 65),
+    (248, 81, 73), (240, 136, 62), (57, 211, 83), (88, 166, 255),
+)
+# Hour-bar intensity, very dark → bright green, split at these max-ratios
+_ACTIVITY_COLORS = ((14, 68, 41), (0, 109, 50), (38, 166, 65), (57, 211, 83))
+_ACTIVITY_THRESHOLDS = (0.25, 0.5, 0.75)
+
+
 class BannerWidget(Static):
     """ASCII art banner at the top of the dashboard."""
 
@@ -59,14 +86,7 @@ class OverviewPanel(Static):
         s = analytics.streaks
         a = analytics.activity
 
-        if a.busiest_hour == 0:
-            hour = "12am"
-        elif a.busiest_hour < 12:
-            hour = f"{a.busiest_hour}am"
-        elif a.busiest_hour == 12:
-            hour = "12pm"
-        else:
-            hour = f"{a.busiest_hour - 12}pm"
+        hour = format_hour(a.busiest_hour)
 
         text = Text()
 
@@ -141,17 +161,7 @@ class LanguagePanel(PlotextPlot):
         values = [v for _, v in reversed(items)]
 
         # Cycle through accent colors
-        color_cycle = [
-            (57, 211, 83),    # green
-            (88, 166, 255),   # cyan
-            (188, 140, 255),  # purple
-            (227, 179, 65),   # yellow
-            (57, 211, 83),
-            (88, 166, 255),
-            (188, 140, 255),
-            (227, 179, 65),
-        ]
-        colors = list(reversed(color_cycle[:len(items)]))
+        colors = list(reversed(_LANG_BAR_COLORS[:len(items)]))
 
         plt.bar(names, values, orientation="horizontal", color=colors)
         plt.title("Lines Changed by Language")
@@ -177,17 +187,10 @@ class ActivityPanel(PlotextPlot):
 
         # Color each bar based on intensity
         max_val = max(hours) or 1
-        colors = []
-        for h in hours:
-            ratio = h / max_val
-            if ratio > 0.75:
-                colors.append((57, 211, 83))    # bright green
-            elif ratio > 0.5:
-                colors.append((38, 166, 65))    # medium green
-            elif ratio > 0.25:
-                colors.append((0, 109, 50))     # dark green
-            else:
-                colors.append((14, 68, 41))     # very dark green
+        colors = [
+            _ACTIVITY_COLORS[bisect_left(_ACTIVITY_THRESHOLDS, h / max_val)]
+            for h in hours
+        ]
 
         plt.bar(labels, hours, color=colors)
         plt.title("Commits by Hour")
@@ -201,16 +204,17 @@ class RepoTable(DataTable):
     def update_data(self, analytics: Analytics) -> None:
         self.clear(columns=True)
         self.add_columns("Repo", "Commits", "Language", "Health", "+Lines", "-Lines")
-        for r in analytics.repo_rankings[:50]:
-            hbar = health_bar(r.health_score)
-            self.add_row(
-                Text(r.name, style=Style(color=CYAN, bold=True)),
-                Text(f"{r.commits:,}", style=Style(color=GREEN, bold=True)),
-                Text(r.primary_language, style=Style(color=YELLOW)),
-                hbar,
-                Text(f"+{r.lines_added:,}", style=Style(color=GREEN)),
-                Text(f"-{r.lines_removed:,}", style=Style(color=RED)),
+        self.add_rows(
+            (
+                Text(r.name, style=_STYLE_CYAN_BOLD),
+                Text(f"{r.commits:,}", style=_STYLE_GREEN_BOLD),
+                Text(r.primary_language, style=_STYLE_YELLOW),
+                health_bar(r.health_score),
+                Text(f"+{r.lines_added:,}", style=_STYLE_GREEN),
+                Text(f"-{r.lines_removed:,}", style=_STYLE_RED),
             )
+            for r in analytics.repo_rankings[:50]
+        )
 
 
 class CodeVelocityPanel(PlotextPlot):
@@ -227,7 +231,7 @@ class CodeVelocityPanel(PlotextPlot):
             self.refresh()
             return
 
-        weeks = sorted(cv.commits_by_week.keys())[-16:]
+        weeks = list(cv.commits_by_week)[-16:]
         values = [cv.commits_by_week[w] for w in weeks]
         labels = [w.split("-W")[1] if "-W" in w else w for w in weeks]
 
@@ -258,17 +262,13 @@ class LanguageEvolutionPanel(PlotextPlot):
             self.refresh()
             return
 
-        month_keys = sorted(le.monthly.keys())[-12:]
+        month_keys = list(le.monthly)[-12:]
         x_indices = list(range(len(month_keys)))
-        color_map = [
-            (57, 211, 83), (88, 166, 255), (188, 140, 255), (227, 179, 65),
-            (248, 81, 73), (240, 136, 62), (57, 211, 83), (88, 166, 255),
-        ]
 
         for i, lang in enumerate(le.top_languages[:6]):
             values = [le.monthly[mk].get(lang, 0) for mk in month_keys]
             if any(values):
-                plt.plot(x_indices, values, label=lang, color=color_map[i % len(color_map)])
+                plt.plot(x_indices, values, label=lang, color=_LANG_EVO_COLORS[i % len(_LANG_EVO_COLORS)])
 
         plt.xticks(x_indices, month_keys)
         plt.title("Language Lines Changed")
@@ -335,12 +335,14 @@ class HotspotTable(DataTable):
     def update_data(self, analytics: Analytics) -> None:
         self.clear(columns=True)
         self.add_columns("File", "Churn", "Touches")
-        for h in analytics.file_hotspots[:15]:
-            self.add_row(
-                Text(h.path, style=Style(color=CYAN)),
-                Text(f"{h.churn:,}", style=Style(color=RED, bold=True)),
-                Text(str(h.touches), style=Style(color=YELLOW)),
+        self.add_rows(
+            (
+                Text(h.path, style=_STYLE_CYAN),
+                Text(f"{h.churn:,}", style=_STYLE_RED_BOLD),
+                Text(str(h.touches), style=_STYLE_YELLOW),
             )
+            for h in analytics.file_hotspots[:15]
+        )
 
 
 class AchievementsPanel(Static):
@@ -364,146 +366,150 @@ class AchievementsPanel(Static):
         self.update(header)
 
 
+# Built once at import; every HuntdApp instance shares the same stylesheet source
+_DASHBOARD_CSS = f"""
+Screen {{
+    background: {BG};
+    color: {MUTED};
+    layout: grid;
+    grid-size: 2 8;
+    grid-gutter: 1;
+    grid-rows: auto auto 1fr 1fr 1fr 1fr 1fr auto;
+}}
+
+Header {{
+    background: {SURFACE};
+    color: {GREEN};
+}}
+
+Footer {{
+    background: {SURFACE};
+    color: {MUTED};
+}}
+
+#banner {{
+    column-span: 2;
+    height: auto;
+    content-align: center middle;
+    background: {BG};
+}}
+
+#overview {{
+    column-span: 2;
+    height: auto;
+    min-height: 6;
+    border: round {BORDER};
+    background: {SURFACE};
+    padding: 1 2;
+}}
+
+#heatmap {{
+    border: round {BORDER};
+    background: {SURFACE};
+    min-height: 12;
+    padding: 0 1;
+    overflow-y: auto;
+}}
+
+#languages {{
+    border: round {BORDER};
+    background: {SURFACE};
+    min-height: 12;
+}}
+
+#repos {{
+    border: round {BORDER};
+    background: {SURFACE};
+    min-height: 10;
+}}
+
+#activity {{
+    border: round {BORDER};
+    background: {SURFACE};
+    min-height: 10;
+}}
+
+#velocity {{
+    border: round {BORDER};
+    background: {SURFACE};
+    min-height: 10;
+}}
+
+#lang-evolution {{
+    border: round {BORDER};
+    background: {SURFACE};
+    min-height: 10;
+}}
+
+#focus {{
+    border: round {BORDER};
+    background: {SURFACE};
+    min-height: 6;
+    padding: 1 2;
+}}
+
+#workday {{
+    border: round {BORDER};
+    background: {SURFACE};
+    min-height: 6;
+    padding: 1 2;
+}}
+
+#hotspots {{
+    column-span: 2;
+    border: round {BORDER};
+    background: {SURFACE};
+    min-height: 10;
+}}
+
+#achievements {{
+    column-span: 2;
+    height: auto;
+    border: round {BORDER};
+    background: {SURFACE};
+    padding: 1 2;
+}}
+
+#loading-container {{
+    column-span: 2;
+    row-span: 4;
+    content-align: center middle;
+    text-align: center;
+    height: 100%;
+    background: {BG};
+}}
+
+LoadingIndicator {{
+    color: {GREEN};
+}}
+
+#loading-text {{
+    color: {MUTED};
+    text-align: center;
+    margin-top: 1;
+}}
+
+DataTable {{
+    background: {SURFACE};
+}}
+
+DataTable > .datatable--header {{
+    background: {BG};
+    color: {CYAN};
+    text-style: bold;
+}}
+
+DataTable > .datatable--cursor {{
+    background: {BORDER};
+    color: {GREEN};
+}}
+"""
+
+
 class HuntdApp(App):
     """huntd — your coding fingerprint."""
 
-    CSS = f"""
-    Screen {{
-        background: {BG};
-        color: {MUTED};
-        layout: grid;
-        grid-size: 2 8;
-        grid-gutter: 1;
-        grid-rows: auto auto 1fr 1fr 1fr 1fr 1fr auto;
-    }}
-
-    Header {{
-        background: {SURFACE};
-        color: {GREEN};
-    }}
-
-    Footer {{
-        background: {SURFACE};
-        color: {MUTED};
-    }}
-
-    #banner {{
-        column-span: 2;
-        height: auto;
-        content-align: center middle;
-        background: {BG};
-    }}
-
-    #overview {{
-        column-span: 2;
-        height: auto;
-        min-height: 6;
-        border: round {BORDER};
-        background: {SURFACE};
-        padding: 1 2;
-    }}
-
-    #heatmap {{
-        border: round {BORDER};
-        background: {SURFACE};
-        min-height: 12;
-        padding: 0 1;
-        overflow-y: auto;
-    }}
-
-    #languages {{
-        border: round {BORDER};
-        background: {SURFACE};
-        min-height: 12;
-    }}
-
-    #repos {{
-        border: round {BORDER};
-        background: {SURFACE};
-        min-height: 10;
-    }}
-
-    #activity {{
-        border: round {BORDER};
-        background: {SURFACE};
-        min-height: 10;
-    }}
-
-    #velocity {{
-        border: round {BORDER};
-        background: {SURFACE};
-        min-height: 10;
-    }}
-
-    #lang-evolution {{
-        border: round {BORDER};
-        background: {SURFACE};
-        min-height: 10;
-    }}
-
-    #focus {{
-        border: round {BORDER};
-        background: {SURFACE};
-        min-height: 6;
-        padding: 1 2;
-    }}
-
-    #workday {{
-        border: round {BORDER};
-        background: {SURFACE};
-        min-height: 6;
-        padding: 1 2;
-    }}
-
-    #hotspots {{
-        column-span: 2;
-        border: round {BORDER};
-        background: {SURFACE};
-        min-height: 10;
-    }}
-
-    #achievements {{
-        column-span: 2;
-        height: auto;
-        border: round {BORDER};
-        background: {SURFACE};
-        padding: 1 2;
-    }}
-
-    #loading-container {{
-        column-span: 2;
-        row-span: 4;
-        content-align: center middle;
-        text-align: center;
-        height: 100%;
-        background: {BG};
-    }}
-
-    LoadingIndicator {{
-        color: {GREEN};
-    }}
-
-    #loading-text {{
-        color: {MUTED};
-        text-align: center;
-        margin-top: 1;
-    }}
-
-    DataTable {{
-        background: {SURFACE};
-    }}
-
-    DataTable > .datatable--header {{
-        background: {BG};
-        color: {CYAN};
-        text-style: bold;
-    }}
-
-    DataTable > .datatable--cursor {{
-        background: {BORDER};
-        color: {GREEN};
-    }}
-    """
+    CSS = _DASHBOARD_CSS
 
     TITLE = "🐺 huntd"
     SUB_TITLE = "your coding fingerprint"
@@ -535,6 +541,7 @@ class HuntdApp(App):
         self.interval = interval
         self.analytics: Optional[Analytics] = None
         self._watch_timer = None
+        self._panels: list[Widget] = []
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -548,36 +555,16 @@ class HuntdApp(App):
         self.run_scan()
 
     def action_refresh(self) -> None:
-        """Re-scan repos."""
-        # Remove existing dashboard widgets
-        for wid in ["#banner", "#overview", "#heatmap", "#languages", "#repos", "#activity",
-                    "#velocity", "#lang-evolution", "#focus", "#workday", "#hotspots",
-                    "#achievements"]:
-            try:
-                self.query_one(wid).remove()
-            except Exception:
-                pass
-
-        # Show loading again
-        container = Static(id="loading-container")
-        self.mount(container, before=self.query_one(Footer))
-        container.mount(LoadingIndicator())
-        container.mount(Label("  Scanning repos...", id="loading-text"))
+        """Re-scan repos, keeping the mounted dashboard widgets in place."""
+        if self._panels:
+            self.sub_title = "refreshing…"
         self.run_scan()
 
     @work(thread=True)
     def run_scan(self) -> None:
         """Scan repos in a background thread."""
-        repo_paths = find_repos(self.scan_path)
-        if not repo_paths:
-            self.call_from_thread(self._show_no_repos)
-            return
-
-        self.call_from_thread(
-            self._update_loading, f"  Found {len(repo_paths)} repos. Scanning..."
-        )
-
-        # Parallel scan
+        # Parallel scan — each repo is submitted as soon as the walk finds it,
+        # so scanning overlaps with directory discovery
         repos: list[RepoInfo] = []
         with ThreadPoolExecutor(max_workers=8) as executor:
             futures = {
@@ -585,8 +572,16 @@ class HuntdApp(App):
                     scan_repo, p,
                     since=self.since, until=self.until, author=self.author,
                 ): p
-                for p in repo_paths
+                for p in find_repos_iter(self.scan_path)
             }
+            if not futures:
+                self.call_from_thread(self._show_no_repos)
+                return
+
+            total = len(futures)
+            self.call_from_thread(
+                self._update_loading, f"  Found {total} repos. Scanning..."
+            )
             for i, future in enumerate(as_completed(futures), 1):
                 try:
                     repos.append(future.result())
@@ -595,10 +590,14 @@ class HuntdApp(App):
                 name = futures[future].split("/")[-1]
                 self.call_from_thread(
                     self._update_loading,
-                    f"  [{i}/{len(repo_paths)}] {name}"
+                    f"  [{i}/{total}] {name}"
                 )
 
         analytics = build_analytics(repos)
+        if self._panels and analytics == self.analytics:
+            # Nothing changed since the last scan — skip the panel updates
+            self.call_from_thread(self._reset_sub_title)
+            return
         self.analytics = analytics
         self.call_from_thread(self._render_dashboard, analytics)
 
@@ -610,14 +609,41 @@ class HuntdApp(App):
             pass
 
     def _show_no_repos(self) -> None:
+        self._reset_sub_title()
+        if self._panels:
+            # A refresh found nothing — drop the now-stale dashboard and bring
+            # the loading screen back; the next scan with repos rebuilds it
+            with self.batch_update():
+                self.query_one("#banner").remove()
+                for panel in self._panels:
+                    panel.remove()
+                self._panels = []
+                self.analytics = None
+                container = Static(id="loading-container")
+                self.mount(container, before=self.query_one(Footer))
+                container.mount(Label("", id="loading-text"))
         try:
             loading = self.query_one("#loading-text", Label)
             loading.update("  No git repos found. Try: huntd ~/code")
         except Exception:
             pass
 
+    def _reset_sub_title(self) -> None:
+        if self.watch:
+            self.sub_title = f"live — refreshing every {self.interval}s"
+        else:
+            self.sub_title = self.SUB_TITLE
+
     def _render_dashboard(self, analytics: Analytics) -> None:
-        """Remove loading screen and mount dashboard widgets."""
+        """Remove loading screen and mount dashboard widgets.
+
+        Once the dashboard is mounted, later scans only push new data into
+        the existing panels.
+        """
+        if self._panels:
+            self._refresh_dashboard(analytics)
+            return
+
         try:
             self.query_one("#loading-container").remove()
         except Exception:
@@ -625,63 +651,42 @@ class HuntdApp(App):
 
         footer = self.query_one(Footer)
 
-        banner = BannerWidget(id="banner")
-        overview = OverviewPanel(id="overview")
-        heatmap = HeatmapPanel(id="heatmap")
-        languages = LanguagePanel(id="languages")
-        repos = RepoTable(id="repos")
-        activity = ActivityPanel(id="activity")
-
-        velocity = CodeVelocityPanel(id="velocity")
-        lang_evo = LanguageEvolutionPanel(id="lang-evolution")
-        focus = FocusScorePanel(id="focus")
-        workday = WorkdaySplitPanel(id="workday")
-        hotspots = HotspotTable(id="hotspots")
-        achievements = AchievementsPanel(id="achievements")
-
-        self.mount(banner, before=footer)
-        self.mount(overview, before=footer)
-        self.mount(heatmap, before=footer)
-        self.mount(languages, before=footer)
-        self.mount(repos, before=footer)
-        self.mount(activity, before=footer)
-        self.mount(velocity, before=footer)
-        self.mount(lang_evo, before=footer)
-        self.mount(focus, before=footer)
-        self.mount(workday, before=footer)
-        self.mount(hotspots, before=footer)
-        self.mount(achievements, before=footer)
-
-        # Set border titles with accents
-        overview.border_title = "🐺 Overview"
-        heatmap.border_title = "📊 Contributions"
-        languages.border_title = "🔤 Languages"
-        repos.border_title = "📦 Repositories"
-        activity.border_title = "⚡ Activity"
-        velocity.border_title = "📈 Velocity"
-        lang_evo.border_title = "📈 Language Evolution"
-        focus.border_title = "🎯 Focus Score"
-        workday.border_title = "📅 Weekday vs Weekend"
-        hotspots.border_title = "🔥 File Hotspots"
-        achievements.border_title = "🏆 Achievements"
-
-        overview.update_data(analytics)
-        heatmap.update_data(analytics)
-        languages.update_data(analytics)
-        repos.update_data(analytics)
-        activity.update_data(analytics)
-        velocity.update_data(analytics)
-        lang_evo.update_data(analytics)
-        focus.update_data(analytics)
-        workday.update_data(analytics)
-        hotspots.update_data(analytics)
-        achievements.update_data(analytics)
+        # Data panels in grid order, with their accented border titles
+        titles = {
+            OverviewPanel(id="overview"): "🐺 Overview",
+            HeatmapPanel(id="heatmap"): "📊 Contributions",
+            LanguagePanel(id="languages"): "🔤 Languages",
+            RepoTable(id="repos"): "📦 Repositories",
+            ActivityPanel(id="activity"): "⚡ Activity",
+            CodeVelocityPanel(id="velocity"): "📈 Velocity",
+            LanguageEvolutionPanel(id="lang-evolution"): "📈 Language Evolution",
+            FocusScorePanel(id="focus"): "🎯 Focus Score",
+            WorkdaySplitPanel(id="workday"): "📅 Weekday vs Weekend",
+            HotspotTable(id="hotspots"): "🔥 File Hotspots",
+            AchievementsPanel(id="achievements"): "🏆 Achievements",
+        }
+
+        # Mount, title and fill everything behind a single layout/paint
+        with self.batch_update():
+            self.mount_all([BannerWidget(id="banner"), *titles], before=footer)
+            for panel, title in titles.items():
+                panel.border_title = title
+            self._panels = list(titles)
+            self._refresh_dashboard(analytics)
 
         # Start watch timer after first render
         if self.watch and self._watch_timer is None:
             self._watch_timer = self.set_interval(self.interval, self._auto_refresh)
             self.sub_title = f"live — refreshing every {self.interval}s"
 
+    def _refresh_dashboard(self, analytics: Analytics) -> None:
+        """Update the already-mounted panels with fresh analytics."""
+        # Each plot refresh() would otherwise request its own repaint
+        with self.batch_update():
+            for panel in self._panels:
+                panel.update_data(analytics)
+        self._reset_sub_title()
+
     def _auto_refresh(self) -> None:
         """Silent auto-refresh triggered by watch timer."""
         self.action_refresh()
@@ -692,7 +697,7 @@ class HuntdApp(App):
             self._watch_timer.stop()
             self._watch_timer = None
             self.watch = False
-            self.sub_title = "your coding fingerprint"
+            self.sub_title = self.SUB_TITLE
         else:
             self.watch = True
             self._watch_timer = self.set_interval(self.interval, self._auto_refresh)
@@ -0,0 +1,10 @@
+"""Shared pytest setup."""
+
+import os
+import tempfile
+
+# Test repos are many tiny git objects — keep scratch dirs (tmp_path and
+# tempfile alike) on tmpfs when the host has one, unless TMPDIR says otherwise.
+_SHM = "/dev/shm"
+if "TMPDIR" not in os.environ and os.path.isdir(_SHM) and os.access(_SHM, os.W_OK):
+    tempfile.tempdir = _SHM
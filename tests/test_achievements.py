@@ -1,6 +1,6 @@
 """Tests for the achievement system."""
 
-from datetime import date, datetime, timedelta, timezone
+import pytest
 
 from huntd.achievements import Achievement, compute_achievements
 from huntd.analytics import (
@@ -15,31 +15,39 @@ from huntd.analytics import (
 )
 
 
+# Built once: compute_achievements only reads Analytics, so every test can share these
+_ZERO_HEATMAP = tuple((0,) * 52 for _ in range(7))  # 7×52, immutable
+_DEFAULTS = dict(
+    total_repos=1,
+    total_commits=10,
+    total_languages=1,
+    streaks=Streaks(current=1, longest=1, today_commits=1),
+    heatmap=_ZERO_HEATMAP,
+    languages={"Python": 500},
+    activity=ActivityPattern(
+        busiest_day="Monday",
+        busiest_hour=14,
+        avg_commits_per_day=1.0,
+        commits_by_hour=[0] * 24,
+        commits_by_dow=[0] * 7,
+    ),
+    repo_rankings=[],
+    language_evolution=LanguageEvolution(),
+    code_velocity=CodeVelocity(),
+    focus_score=FocusScore(),
+    workday_split=WorkdaySplit(),
+    file_hotspots=[],
+)
+
+
 def _base_analytics(**overrides) -> Analytics:
     """Build a minimal Analytics with sensible defaults, overriding fields as needed."""
-    defaults = dict(
-        total_repos=1,
-        total_commits=10,
-        total_languages=1,
-        streaks=Streaks(current=1, longest=1, today_commits=1),
-        heatmap=[[0] * 52 for _ in range(7)],
-        languages={"Python": 500},
-        activity=ActivityPattern(
-            busiest_day="Monday",
-            busiest_hour=14,
-            avg_commits_per_day=1.0,
-            commits_by_hour=[0] * 24,
-            commits_by_dow=[0] * 7,
-        ),
-        repo_rankings=[],
-        language_evolution=LanguageEvolution(),
-        code_velocity=CodeVelocity(),
-        focus_score=FocusScore(),
-        workday_split=WorkdaySplit(),
-        file_hotspots=[],
-    )
-    defaults.update(overrides)
-    return Analytics(**defaults)
+    return Analytics(**{**_DEFAULTS, **overrides})
+
+
+def _badge(analytics: Analytics, name: str) -> Achievement:
+    """Compute achievements and return the one called `name`."""
+    return {b.name: b for b in compute_achievements(analytics)}[name]
 
 
 # --- Basic ---
@@ -54,48 +62,28 @@ def test_compute_achievements_returns_list():
 
 def test_all_locked_by_default():
     a = _base_analytics()
-    badges = compute_achievements(a)
-    unlocked = [b for b in badges if b.unlocked]
-    assert len(unlocked) == 0
+    assert not any(b.unlocked for b in compute_achievements(a))
 
 
 # --- Streak achievements ---
 
 def test_century_unlocked():
     a = _base_analytics(streaks=Streaks(current=100, longest=100, today_commits=1))
-    badges = compute_achievements(a)
-    century = next(b for b in badges if b.name == "Century")
-    assert century.unlocked is True
+    assert _badge(a, "Century").unlocked is True
 
 
-def test_marathon_unlocked():
-    a = _base_analytics(streaks=Streaks(current=365, longest=365, today_commits=1))
-    badges = compute_achievements(a)
-    marathon = next(b for b in badges if b.name == "Marathon")
-    assert marathon.unlocked is True
-
-
-def test_marathon_locked_at_364():
-    a = _base_analytics(streaks=Streaks(current=364, longest=364, today_commits=1))
-    badges = compute_achievements(a)
-    marathon = next(b for b in badges if b.name == "Marathon")
-    assert marathon.unlocked is False
+@pytest.mark.parametrize("streak, expected", [(365, True), (364, False)])
+def test_marathon(streak, expected):
+    a = _base_analytics(streaks=Streaks(current=streak, longest=streak, today_commits=1))
+    assert _badge(a, "Marathon").unlocked is expected
 
 
 # --- Commit volume ---
 
-def test_prolific_unlocked():
-    a = _base_analytics(total_commits=1000)
-    badges = compute_achievements(a)
-    prolific = next(b for b in badges if b.name == "Prolific")
-    assert prolific.unlocked is True
-
-
-def test_prolific_locked_under_1000():
-    a = _base_analytics(total_commits=999)
-    badges = compute_achievements(a)
-    prolific = next(b for b in badges if b.name == "Prolific")
-    assert prolific.unlocked is False
+@pytest.mark.parametrize("commits, expected", [(1000, True), (999, False)])
+def test_prolific(commits, expected):
+    a = _base_analytics(total_commits=commits)
+    assert _badge(a, "Prolific").unlocked is expected
 
 
 # --- Time-of-day ---
@@ -107,9 +95,7 @@ def test_night_owl_unlocked():
         busiest_day="Monday", busiest_hour=2, avg_commits_per_day=1.0,
         commits_by_hour=hours, commits_by_dow=[0] * 7,
     ))
-    badges = compute_achievements(a)
-    owl = next(b for b in badges if b.name == "Night Owl")
-    assert owl.unlocked is True
+    assert _badge(a, "Night Owl").unlocked is True
 
 
 def test_early_bird_unlocked():
@@ -119,60 +105,39 @@ def test_early_bird_unlocked():
         busiest_day="Monday", busiest_hour=6, avg_commits_per_day=1.0,
         commits_by_hour=hours, commits_by_dow=[0] * 7,
     ))
-    badges = compute_achievements(a)
-    bird = next(b for b in badges if b.name == "Early Bird")
-    assert bird.unlocked is True
+    assert _badge(a, "Early Bird").unlocked is True
 
 
 # --- Weekend warrior ---
 
-def test_weekend_warrior_unlocked():
-    a = _base_analytics(workday_split=WorkdaySplit(
-        weekday_commits=60, weekend_commits=40,
-        weekday_pct=60.0, weekend_pct=40.0,
-        weekday_lines=0, weekend_lines=0,
-    ))
-    badges = compute_achievements(a)
-    warrior = next(b for b in badges if b.name == "Weekend Warrior")
-    assert warrior.unlocked is True
-
-
-def test_weekend_warrior_locked_under_40():
+@pytest.mark.parametrize("weekend, expected", [(40, True), (30, False)])
+def test_weekend_warrior(weekend, expected):
+    weekday = 100 - weekend
     a = _base_analytics(workday_split=WorkdaySplit(
-        weekday_commits=70, weekend_commits=30,
-        weekday_pct=70.0, weekend_pct=30.0,
+        weekday_commits=weekday, weekend_commits=weekend,
+        weekday_pct=weekday * 100 / (weekday + weekend),
+        weekend_pct=weekend * 100 / (weekday + weekend),
         weekday_lines=0, weekend_lines=0,
     ))
-    badges = compute_achievements(a)
-    warrior = next(b for b in badges if b.name == "Weekend Warrior")
-    assert warrior.unlocked is False
+    assert _badge(a, "Weekend Warrior").unlocked is expected
 
 
 # --- Language diversity ---
 
-def test_polyglot_unlocked():
-    langs = {f"Lang{i}": 200 for i in range(5)}
-    a = _base_analytics(languages=langs, total_languages=5)
-    badges = compute_achievements(a)
-    poly = next(b for b in badges if b.name == "Polyglot")
-    assert poly.unlocked is True
-
-
-def test_polyglot_locked_few_languages():
-    langs = {"Python": 500, "JS": 200}
-    a = _base_analytics(languages=langs, total_languages=2)
-    badges = compute_achievements(a)
-    poly = next(b for b in badges if b.name == "Polyglot")
-    assert poly.unlocked is False
+@pytest.mark.parametrize("langs, expected", [
+    ({f"Lang{i}": 200 for i in range(5)}, True),
+    ({"Python": 500, "JS": 200}, False),
+])
+def test_polyglot(langs, expected):
+    a = _base_analytics(languages=langs, total_languages=len(langs))
+    assert _badge(a, "Polyglot").unlocked is expected
 
 
 # --- Repo achievements ---
 
 def test_diversified_unlocked():
     a = _base_analytics(total_repos=10)
-    badges = compute_achievements(a)
-    div = next(b for b in badges if b.name == "Diversified")
-    assert div.unlocked is True
+    assert _badge(a, "Diversified").unlocked is True
 
 
 def test_monorepo_monster_unlocked():
@@ -180,30 +145,16 @@ def test_monorepo_monster_unlocked():
                           primary_language="Python", health_score=80,
                           lines_added=5000, lines_removed=1000)
     a = _base_analytics(repo_rankings=[ranking])
-    badges = compute_achievements(a)
-    mono = next(b for b in badges if b.name == "Monorepo Monster")
-    assert mono.unlocked is True
+    assert _badge(a, "Monorepo Monster").unlocked is True
 
 
 # --- Health ---
 
-def test_clean_freak_unlocked():
+@pytest.mark.parametrize("second_health, expected", [(85, True), (50, False)])
+def test_clean_freak(second_health, expected):
     rankings = [
         RepoRanking(path="/a", name="a", commits=10, primary_language="Py", health_score=90, lines_added=100, lines_removed=10),
-        RepoRanking(path="/b", name="b", commits=20, primary_language="Py", health_score=85, lines_added=200, lines_removed=20),
+        RepoRanking(path="/b", name="b", commits=20, primary_language="Py", health_score=second_health, lines_added=200, lines_removed=20),
     ]
     a = _base_analytics(repo_rankings=rankings)
-    badges = compute_achievements(a)
-    clean = next(b for b in badges if b.name == "Clean Freak")
-    assert clean.unlocked is True
-
-
-def test_clean_freak_locked_low_health():
-    rankings = [
-        RepoRanking(path="/a", name="a", commits=10, primary_language="Py", health_score=90, lines_added=100, lines_removed=10),
-        RepoRanking(path="/b", name="b", commits=20, primary_language="Py", health_score=50, lines_added=200, lines_removed=20),
-    ]
-    a = _base_analytics(repo_rankings=rankings)
-    badges = compute_achievements(a)
-    clean = next(b for b in badges if b.name == "Clean Freak")
-    assert clean.unlocked is False
+    assert _badge(a, "Clean Freak").unlocked is expected
@@ -1,6 +1,8 @@
 """Tests for analytics computations."""
 
-from datetime import date, datetime, timedelta, timezone
+from dataclasses import replace
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
 
 from huntd.analytics import (
     compute_activity_patterns,
@@ -13,16 +15,27 @@ from huntd.analytics import (
     compute_languages,
     compute_streaks,
     compute_workday_split,
+    format_hour,
 )
 from huntd.git import Commit, FileChange, RepoInfo
 
+# Any valid timestamp will do for FileChanges that don't test recency
+_NOW_UTC = datetime.now(timezone.utc)
+# Read the clock once; commit builders count days back from here
+_TODAY = date.today()
+
+
+@lru_cache(maxsize=None)
+def _local_tz(d: date, hour: int) -> tzinfo:
+    """Local UTC offset in effect at `hour` on `d` — per day, so DST shifts are honoured."""
+    return datetime(d.year, d.month, d.day, hour).astimezone().tzinfo
+
 
 def _make_commit(days_ago: int = 0, hour: int = 12, insertions: int = 10, deletions: int = 5) -> Commit:
     """Create a test commit at `days_ago` days in the past at a specific local hour."""
-    today = date.today()
-    d = today - timedelta(days=days_ago)
-    # Create a naive datetime at the specified hour, then make it tz-aware in local time
-    ts = datetime(d.year, d.month, d.day, hour, 30, 0).astimezone()
+    d = _TODAY - timedelta(days=days_ago)
+    # Tz-aware local time at the specified hour
+    ts = datetime(d.year, d.month, d.day, hour, 30, 0, tzinfo=_local_tz(d, hour))
     return Commit(
         hash="abc123",
         author="Test",
@@ -104,9 +117,9 @@ def test_heatmap_has_values():
 
 def test_languages_basic():
     changes = [
-        FileChange("a", datetime.now(timezone.utc), "main.py", ".py", 100, 20),
-        FileChange("b", datetime.now(timezone.utc), "app.js", ".js", 50, 10),
-        FileChange("c", datetime.now(timezone.utc), "util.py", ".py", 30, 5),
+        FileChange("a", _NOW_UTC, "main.py", ".py", 100, 20),
+        FileChange("b", _NOW_UTC, "app.js", ".js", 50, 10),
+        FileChange("c", _NOW_UTC, "util.py", ".py", 30, 5),
     ]
     langs = compute_languages(changes)
     assert "Python" in langs
@@ -121,7 +134,7 @@ def test_languages_empty():
 
 def test_languages_unknown_ext():
     changes = [
-        FileChange("a", datetime.now(timezone.utc), "data.xyz", ".xyz", 10, 0),
+        FileChange("a", _NOW_UTC, "data.xyz", ".xyz", 10, 0),
     ]
     langs = compute_languages(changes)
     assert ".xyz" in langs
@@ -148,12 +161,22 @@ def test_activity_commits_by_hour():
     assert a.commits_by_hour[10] >= 2
 
 
+def test_format_hour():
+    assert format_hour(0) == "12am"
+    assert format_hour(9) == "9am"
+    assert format_hour(12) == "12pm"
+    assert format_hour(23) == "11pm"
+
+
 # --- Health Score ---
 
+# Bare repo with every scored field at its zero value; tests replace() the deltas
+_BASE_REPO = RepoInfo(path="/test", name="test")
+
+
 def test_health_score_perfect():
-    repo = RepoInfo(
-        path="/test",
-        name="test",
+    repo = replace(
+        _BASE_REPO,
         branch_count=2,
         last_commit=datetime.now(timezone.utc),
         has_readme=True,
@@ -165,15 +188,13 @@ def test_health_score_perfect():
 
 
 def test_health_score_minimal():
-    repo = RepoInfo(path="/test", name="test")
-    score = compute_health_score(repo)
+    score = compute_health_score(_BASE_REPO)
     assert score == 0
 
 
 def test_health_score_old_repo():
-    repo = RepoInfo(
-        path="/test",
-        name="test",
+    repo = replace(
+        _BASE_REPO,
         branch_count=3,
         last_commit=datetime.now(timezone.utc) - timedelta(days=60),
         has_readme=True,
@@ -188,9 +209,8 @@ def test_health_score_old_repo():
 # --- Helpers for v0.3 tests ---
 
 def _make_file_change(days_ago: int, ext: str, added: int = 50, removed: int = 10) -> FileChange:
-    today = date.today()
-    d = today - timedelta(days=days_ago)
-    ts = datetime(d.year, d.month, d.day, 12, 0, 0).astimezone()
+    d = _TODAY - timedelta(days=days_ago)
+    ts = datetime(d.year, d.month, d.day, 12, 0, 0, tzinfo=_local_tz(d, 12))
     return FileChange(hash="abc123", timestamp=ts, path=f"file{ext}", ext=ext, added=added, removed=removed)
 
 
@@ -229,6 +249,13 @@ def test_language_evolution_top_languages_ordered():
     assert le.top_languages[0] == "Python"
 
 
+def test_language_evolution_months_in_order():
+    changes = [_make_file_change(d, ".py") for d in (0, 95, 40, 200)]
+    le = compute_language_evolution(changes)
+    months = list(le.monthly)
+    assert months == sorted(months)
+
+
 # --- Code Velocity ---
 
 def test_code_velocity_empty():
@@ -246,6 +273,14 @@ def test_code_velocity_groups_by_week():
     assert cv.peak_week != ""
 
 
+def test_code_velocity_weeks_in_order():
+    commits = [_make_commit(i * 3) for i in range(30)]
+    cv = compute_code_velocity(commits)
+    weeks = list(cv.commits_by_week)
+    assert weeks == sorted(weeks)
+    assert list(cv.lines_by_week) == weeks
+
+
 def test_code_velocity_trend_stable_on_short_history():
     commits = [_make_commit(i * 7) for i in range(3)]
     cv = compute_code_velocity(commits)
@@ -284,11 +319,10 @@ def test_workday_split_empty():
 
 
 def test_workday_split_all_weekday():
-    today = date.today()
     commits = []
     for weeks_ago in range(4):
-        d = today - timedelta(days=today.weekday() + weeks_ago * 7)
-        ts = datetime(d.year, d.month, d.day, 10, 0, 0).astimezone()
+        d = _TODAY - timedelta(days=_TODAY.weekday() + weeks_ago * 7)
+        ts = datetime(d.year, d.month, d.day, 10, 0, 0, tzinfo=_local_tz(d, 10))
         commits.append(Commit("h", "T", "t@t", ts, "s", 10, 5, 1))
     ws = compute_workday_split(commits)
     assert ws.weekday_commits == 4
@@ -312,15 +346,15 @@ def test_file_hotspots_empty():
 
 
 def test_file_hotspots_prefixes_repo_name():
-    fc = FileChange("hash1", datetime.now(timezone.utc), "src/main.py", ".py", 200, 50)
+    fc = FileChange("hash1", _NOW_UTC, "src/main.py", ".py", 200, 50)
     repo = _make_repo_with_file_changes("myrepo", [fc])
     hotspots = compute_file_hotspots([repo])
     assert hotspots[0].path == "myrepo/src/main.py"
 
 
 def test_file_hotspots_sorted_by_churn():
-    fc1 = FileChange("h1", datetime.now(timezone.utc), "big.py", ".py", 1000, 500)
-    fc2 = FileChange("h2", datetime.now(timezone.utc), "small.py", ".py", 10, 5)
+    fc1 = FileChange("h1", _NOW_UTC, "big.py", ".py", 1000, 500)
+    fc2 = FileChange("h2", _NOW_UTC, "small.py", ".py", 10, 5)
     repo = _make_repo_with_file_changes("r", [fc1, fc2])
     hotspots = compute_file_hotspots([repo])
     assert hotspots[0].path == "r/big.py"
@@ -328,8 +362,8 @@ def test_file_hotspots_sorted_by_churn():
 
 
 def test_file_hotspots_counts_unique_touches():
-    fc1 = FileChange("hash1", datetime.now(timezone.utc), "hot.py", ".py", 100, 0)
-    fc2 = FileChange("hash2", datetime.now(timezone.utc), "hot.py", ".py", 200, 0)
+    fc1 = FileChange("hash1", _NOW_UTC, "hot.py", ".py", 100, 0)
+    fc2 = FileChange("hash2", _NOW_UTC, "hot.py", ".py", 200, 0)
     repo = _make_repo_with_file_changes("r", [fc1, fc2])
     hotspots = compute_file_hotspots([repo])
     assert hotspots[0].touches == 2
@@ -338,7 +372,7 @@ def test_file_hotspots_counts_unique_touches():
 
 def test_file_hotspots_respects_top_n():
     changes = [
-        FileChange(f"h{i}", datetime.now(timezone.utc), f"file{i}.py", ".py", i * 10, 0)
+        FileChange(f"h{i}", _NOW_UTC, f"file{i}.py", ".py", i * 10, 0)
         for i in range(20)
     ]
     repo = _make_repo_with_file_changes("r", changes)
@@ -0,0 +1,22 @@
+"""Tests for the CLI entry point."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Run the child from the repo root so it imports this checkout of huntd
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_cli_import_skips_tui_dependencies():
+    """--help/--version/--json must not pay for importing Textual or Rich."""
+    code = (
+        "import sys, huntd.cli; "
+        "print(sorted(m for m in ('textual', 'textual_plotext', 'rich', 'huntd.tui') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, cwd=_REPO_ROOT,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
@@ -1,129 +1,205 @@
 """Tests for git data extraction."""
 
+import functools
 import os
+import shutil
 import subprocess
-import tempfile
+import time
+from pathlib import Path
 
 import pytest
 
-from huntd.git import get_commits, get_file_stats, get_repo_info, scan_repo
+from huntd.git import (
+    get_commits,
+    get_commits_and_files,
+    get_file_stats,
+    get_repo_info,
+    scan_repo,
+    scan_repos,
+)
+
+# Fixture git runs isolated from the developer's config, hooks and templates
+_GIT_ENV = {
+    **os.environ,
+    "GIT_CONFIG_GLOBAL": os.devnull,
+    "GIT_CONFIG_SYSTEM": os.devnull,
+    "GIT_TEMPLATE_DIR": "",
+}
+_GIT_FLAGS = [
+    "-c", f"core.hooksPath={os.devnull}",
+    "-c", "gc.auto=0",
+    "-c", "init.defaultBranch=main",
+    "-c", "core.fsync=none",  # throwaway repos: skip durability syncs (git >= 2.36)
+]
+
+# Fixture git calls never read their output — skip the pipes, but fail loudly
+_RUN = functools.partial(
+    subprocess.run, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True, env=_GIT_ENV,
+)
+
+
+def _git(*args: str, input: bytes | None = None) -> None:
+    """Run a fixture git command with the isolating flags and environment."""
+    if input is None:
+        _RUN(["git", *_GIT_FLAGS, *args], stdin=subprocess.DEVNULL)
+    else:
+        _RUN(["git", *_GIT_FLAGS, *args], input=input)
+
+
+def _commit_record(name: str, email: str, when: int, message: str, files: dict[str, str]) -> bytes:
+    """One ``git fast-import`` commit on main, writing `files` as inline blobs."""
+    ident = f"{name} <{email}> {when} +0000"
+    msg = message.encode()
+    record = (
+        f"commit refs/heads/main\nauthor {ident}\ncommitter {ident}\n".encode()
+        + b"data %d\n%s\n" % (len(msg), msg)
+    )
+    for filename, content in files.items():
+        data = content.encode()
+        record += b"M 100644 inline %s\ndata %d\n%s\n" % (filename.encode(), len(data), data)
+    return record
+
+
+def _fast_import(path: str, stream: bytes) -> str:
+    """Init a repo at `path`, load `stream` into it and check out a clean tree."""
+    _git("init", path)
+    _git("-C", path, "fast-import", "--quiet", input=stream)
+    _git("-C", path, "reset", "--hard")
+    return path
 
 
 def _create_test_repo(path: str) -> str:
-    """Create a real git repo with some commits for testing."""
-    subprocess.run(["git", "init", path], capture_output=True)
-    subprocess.run(["git", "-C", path, "config", "user.email", "test@test.com"], capture_output=True)
-    subprocess.run(["git", "-C", path, "config", "user.name", "Test User"], capture_output=True)
-
-    # Commit 1: add a Python file
-    py_file = os.path.join(path, "main.py")
-    with open(py_file, "w") as f:
-        f.write("print('hello world')\n")
-    subprocess.run(["git", "-C", path, "add", "."], capture_output=True)
-    subprocess.run(["git", "-C", path, "commit", "-m", "Initial commit"], capture_output=True)
-
-    # Commit 2: add a JS file
-    js_file = os.path.join(path, "app.js")
-    with open(js_file, "w") as f:
-        f.write("console.log('hello');\n")
-    subprocess.run(["git", "-C", path, "add", "."], capture_output=True)
-    subprocess.run(["git", "-C", path, "commit", "-m", "Add JS file"], capture_output=True)
-
-    # Commit 3: modify Python file
-    with open(py_file, "a") as f:
-        f.write("print('goodbye')\n")
-    subprocess.run(["git", "-C", path, "add", "."], capture_output=True)
-    subprocess.run(["git", "-C", path, "commit", "-m", "Update Python file"], capture_output=True)
-
-    # Add a README
-    readme = os.path.join(path, "README.md")
-    with open(readme, "w") as f:
-        f.write("# Test\n")
-    subprocess.run(["git", "-C", path, "add", "."], capture_output=True)
-    subprocess.run(["git", "-C", path, "commit", "-m", "Add README"], capture_output=True)
-
-    return path
+    """Create a real git repo with some commits for testing.
+
+    All four commits go through a single ``git fast-import`` stream, one
+    second apart and ending now, so history order never rests on a tie.
+    """
+    steps = [
+        ("Initial commit", {"main.py": "print('hello world')\n"}),
+        ("Add JS file", {"app.js": "console.log('hello');\n"}),
+        ("Update Python file", {"main.py": "print('hello world')\nprint('goodbye')\n"}),
+        ("Add README", {"README.md": "# Test\n"}),
+    ]
+    start = int(time.time()) - len(steps)
+    stream = b"".join(
+        _commit_record("Test User", "test@test.com", start + i, message, files)
+        for i, (message, files) in enumerate(steps)
+    )
+
+    return _fast_import(path, stream)
+
+
+@pytest.fixture(scope="session")
+def shared_repo(tmp_path_factory) -> str:
+    """The 4-commit test repo, built once per session. Treat as read-only."""
+    path = tmp_path_factory.mktemp("repo") / "test-repo"
+    return _create_test_repo(str(path))
+
+
+@pytest.fixture
+def repo_copy(shared_repo, tmp_path) -> str:
+    """A private copy of the shared repo for tests that modify it."""
+    return str(shutil.copytree(shared_repo, tmp_path / "test-repo"))
+
+
+@pytest.fixture(scope="session")
+def empty_message_repo(tmp_path_factory) -> str:
+    """History with empty commit messages, one of them with no changes either."""
+    steps = [
+        ("First", {"a.py": "print('a')\n"}),
+        ("", {"b.py": "print('b')\n"}),
+        ("", {}),
+        ("Last", {"a.py": "print('a')\nprint('a 2')\n"}),
+    ]
+    start = int(time.time()) - len(steps)
+    stream = b"".join(
+        _commit_record("Test User", "test@test.com", start + i, message, files)
+        for i, (message, files) in enumerate(steps)
+    )
+    return _fast_import(str(tmp_path_factory.mktemp("empty-msg") / "repo"), stream)
+
+
+def test_get_commits(shared_repo):
+    commits = get_commits(shared_repo)
+    assert len(commits) == 4
+    assert commits[0].subject == "Add README"  # most recent first
+    assert commits[0].author == "Test User"
+    assert commits[0].email == "test@test.com"
+
+
+def test_get_commits_has_stats(shared_repo):
+    commits = get_commits(shared_repo)
+    # At least some commits should have insertion stats
+    has_insertions = any(c.insertions > 0 for c in commits)
+    assert has_insertions
+
+
+def test_get_commits_empty_repo(tmp_path):
+    repo = str(tmp_path / "empty")
+    _git("init", repo)
+    commits = get_commits(repo)
+    assert commits == []
 
 
-def test_get_commits():
-    with tempfile.TemporaryDirectory() as tmp:
-        repo = _create_test_repo(os.path.join(tmp, "test-repo"))
-        commits = get_commits(repo)
-        assert len(commits) == 4
-        assert commits[0].subject == "Add README"  # most recent first
-        assert commits[0].author == "Test User"
-        assert commits[0].email == "test@test.com"
+def test_get_commits_nonexistent():
+    commits = get_commits("/nonexistent/path")
+    assert commits == []
 
 
-def test_get_commits_has_stats():
-    with tempfile.TemporaryDirectory() as tmp:
-        repo = _create_test_repo(os.path.join(tmp, "test-repo"))
-        commits = get_commits(repo)
-        # At least some commits should have insertion stats
-        has_insertions = any(c.insertions > 0 for c in commits)
-        assert has_insertions
+def test_get_file_stats(shared_repo):
+    changes = get_file_stats(shared_repo)
+    assert len(changes) > 0
+    exts = {fc.ext for fc in changes}
+    assert ".py" in exts
+    assert ".js" in exts
 
 
-def test_get_commits_empty_repo():
-    with tempfile.TemporaryDirectory() as tmp:
-        repo = os.path.join(tmp, "empty")
-        subprocess.run(["git", "init", repo], capture_output=True)
-        commits = get_commits(repo)
-        assert commits == []
+def test_get_file_stats_has_line_counts(shared_repo):
+    changes = get_file_stats(shared_repo)
+    total_added = sum(fc.added for fc in changes)
+    assert total_added > 0
 
 
-def test_get_commits_nonexistent():
-    commits = get_commits("/nonexistent/path")
-    assert commits == []
+def test_get_commits_and_files_matches_separate_calls(shared_repo):
+    commits, changes = get_commits_and_files(shared_repo)
+    assert commits == get_commits(shared_repo)
+    assert changes == get_file_stats(shared_repo)
 
 
-def test_get_file_stats():
-    with tempfile.TemporaryDirectory() as tmp:
-        repo = _create_test_repo(os.path.join(tmp, "test-repo"))
-        changes = get_file_stats(repo)
-        assert len(changes) > 0
-        exts = {fc.ext for fc in changes}
-        assert ".py" in exts
-        assert ".js" in exts
+def test_get_commits_and_files_nonexistent():
+    assert get_commits_and_files("/nonexistent/path") == ([], [])
 
 
-def test_get_file_stats_has_line_counts():
-    with tempfile.TemporaryDirectory() as tmp:
-        repo = _create_test_repo(os.path.join(tmp, "test-repo"))
-        changes = get_file_stats(repo)
-        total_added = sum(fc.added for fc in changes)
-        assert total_added > 0
+def test_get_commits_and_files_empty_subjects(empty_message_repo):
+    commits, changes = get_commits_and_files(empty_message_repo)
+    assert [c.subject for c in commits] == ["Last", "", "", "First"]
+    assert sorted(fc.path for fc in changes) == ["a.py", "a.py", "b.py"]
+    assert commits == get_commits(empty_message_repo)
+    assert changes == get_file_stats(empty_message_repo)
 
 
-def test_get_repo_info():
-    with tempfile.TemporaryDirectory() as tmp:
-        repo = _create_test_repo(os.path.join(tmp, "test-repo"))
-        info = get_repo_info(repo)
-        assert info.name == "test-repo"
-        assert info.total_commits == 4
-        assert info.has_readme is True
-        assert info.branch_count >= 1
-        assert info.last_commit is not None
-        assert info.is_dirty is False
+def test_get_repo_info(shared_repo):
+    info = get_repo_info(shared_repo)
+    assert info.name == "test-repo"
+    assert info.total_commits == 4
+    assert info.has_readme is True
+    assert info.branch_count >= 1
+    assert info.last_commit is not None
+    assert info.is_dirty is False
 
 
-def test_get_repo_info_dirty():
-    with tempfile.TemporaryDirectory() as tmp:
-        repo = _create_test_repo(os.path.join(tmp, "test-repo"))
-        # Make it dirty
-        with open(os.path.join(repo, "dirty.txt"), "w") as f:
-            f.write("uncommitted\n")
-        info = get_repo_info(repo)
-        assert info.is_dirty is True
+def test_get_repo_info_dirty(repo_copy):
+    # Make it dirty
+    Path(repo_copy, "dirty.txt").write_text("uncommitted\n")
+    info = get_repo_info(repo_copy)
+    assert info.is_dirty is True
 
 
-def test_scan_repo_full():
-    with tempfile.TemporaryDirectory() as tmp:
-        repo = _create_test_repo(os.path.join(tmp, "test-repo"))
-        info = scan_repo(repo)
-        assert info.total_commits == 4
-        assert len(info.commits) == 4
-        assert len(info.file_changes) > 0
+def test_scan_repo_full(shared_repo):
+    info = scan_repo(shared_repo)
+    assert info.total_commits == 4
+    assert len(info.commits) == 4
+    assert len(info.file_changes) > 0
 
 
 # ── Filter Tests ────────────────────────────────────────────────────────
@@ -131,80 +207,94 @@ def test_scan_repo_full():
 
 def _create_multi_author_repo(path: str) -> str:
     """Create a repo with commits from two different authors."""
-    subprocess.run(["git", "init", path], capture_output=True)
-
-    # Author 1: Alice
-    subprocess.run(["git", "-C", path, "config", "user.email", "alice@test.com"], capture_output=True)
-    subprocess.run(["git", "-C", path, "config", "user.name", "Alice"], capture_output=True)
-    with open(os.path.join(path, "a.py"), "w") as f:
-        f.write("print('alice')\n")
-    subprocess.run(["git", "-C", path, "add", "."], capture_output=True)
-    subprocess.run(["git", "-C", path, "commit", "-m", "Alice commit 1"], capture_output=True)
-
-    with open(os.path.join(path, "a.py"), "a") as f:
-        f.write("print('alice 2')\n")
-    subprocess.run(["git", "-C", path, "add", "."], capture_output=True)
-    subprocess.run(["git", "-C", path, "commit", "-m", "Alice commit 2"], capture_output=True)
-
-    # Author 2: Bob
-    subprocess.run(["git", "-C", path, "config", "user.email", "bob@test.com"], capture_output=True)
-    subprocess.run(["git", "-C", path, "config", "user.name", "Bob"], capture_output=True)
-    with open(os.path.join(path, "b.py"), "w") as f:
-        f.write("print('bob')\n")
-    subprocess.run(["git", "-C", path, "add", "."], capture_output=True)
-    subprocess.run(["git", "-C", path, "commit", "-m", "Bob commit 1"], capture_output=True)
-
-    return path
-
-
-def test_get_commits_with_author_filter():
-    with tempfile.TemporaryDirectory() as tmp:
-        repo = _create_multi_author_repo(os.path.join(tmp, "multi"))
-        # All commits
-        all_commits = get_commits(repo)
-        assert len(all_commits) == 3
-
-        # Only Alice
-        alice_commits = get_commits(repo, author="Alice")
-        assert len(alice_commits) == 2
-        assert all(c.author == "Alice" for c in alice_commits)
-
-        # Only Bob
-        bob_commits = get_commits(repo, author="Bob")
-        assert len(bob_commits) == 1
-        assert bob_commits[0].author == "Bob"
-
-
-def test_get_file_stats_with_author_filter():
-    with tempfile.TemporaryDirectory() as tmp:
-        repo = _create_multi_author_repo(os.path.join(tmp, "multi"))
-        # Alice's file changes
-        alice_changes = get_file_stats(repo, author="Alice")
-        assert all(fc.path == "a.py" for fc in alice_changes)
-
-        # Bob's file changes
-        bob_changes = get_file_stats(repo, author="Bob")
-        assert all(fc.path == "b.py" for fc in bob_changes)
-
-
-def test_get_commits_with_since_filter():
-    with tempfile.TemporaryDirectory() as tmp:
-        repo = _create_test_repo(os.path.join(tmp, "test-repo"))
-        # All commits are from right now, so "since 1 hour ago" should get them all
-        commits = get_commits(repo, since="1 hour ago")
-        assert len(commits) == 4
-
-        # "since tomorrow" should get none
-        commits_future = get_commits(repo, since="2099-01-01")
-        assert len(commits_future) == 0
-
-
-def test_scan_repo_with_filters():
-    with tempfile.TemporaryDirectory() as tmp:
-        repo = _create_multi_author_repo(os.path.join(tmp, "multi"))
-        # Filtered scan — only Alice's work
-        info = scan_repo(repo, author="Alice")
-        assert len(info.commits) == 2
-        assert all(c.author == "Alice" for c in info.commits)
-        # repo_info (total_commits, branch_count) stays unfiltered
-        assert info.total_commits == 3
+    alice = ("Alice", "alice@test.com")
+    bob = ("Bob", "bob@test.com")
+    steps = [
+        (alice, "Alice commit 1", {"a.py": "print('alice')\n"}),
+        (alice, "Alice commit 2", {"a.py": "print('alice')\nprint('alice 2')\n"}),
+        (bob, "Bob commit 1", {"b.py": "print('bob')\n"}),
+    ]
+    start = int(time.time()) - len(steps)
+    stream = b"".join(
+        _commit_record(name, email, start + i, message, files)
+        for i, ((name, email), message, files) in enumerate(steps)
+    )
+    return _fast_import(path, stream)
+
+
+@pytest.fixture(scope="session")
+def multi_author_repo(tmp_path_factory) -> str:
+    """The Alice/Bob repo, built once per session. Treat as read-only."""
+    path = tmp_path_factory.mktemp("multi") / "multi"
+    return _create_multi_author_repo(str(path))
+
+
+def test_scan_repo_total_matches_rev_list(empty_message_repo):
+    # Unfiltered scans count commits from the log — must equal rev-list's count
+    info = scan_repo(empty_message_repo)
+    assert info.total_commits == get_repo_info(empty_message_repo).total_commits == 4
+
+
+def test_scan_repo_counts_commits_when_log_fails(shared_repo, monkeypatch):
+    # Simulate the heavy log pass timing out: _run_git returns "" for it
+    monkeypatch.setattr("huntd.git.get_commits_and_files", lambda *a, **kw: ([], []))
+    info = scan_repo(shared_repo)
+    assert info.commits == []
+    assert info.total_commits == 4
+
+
+def test_scan_repos_keeps_input_order(shared_repo, multi_author_repo):
+    done: list[str] = []
+    paths = [multi_author_repo, "/nonexistent/path", shared_repo]
+    infos = scan_repos(paths, workers=2, on_progress=lambda i, p: done.append(p))
+    assert [info.path for info in infos] == paths
+    assert [info.total_commits for info in infos] == [3, 0, 4]
+    assert sorted(done) == sorted(paths)
+
+
+def test_get_commits_with_author_filter(multi_author_repo):
+    repo = multi_author_repo
+    # All commits
+    all_commits = get_commits(repo)
+    assert len(all_commits) == 3
+
+    # Only Alice
+    alice_commits = get_commits(repo, author="Alice")
+    assert len(alice_commits) == 2
+    assert all(c.author == "Alice" for c in alice_commits)
+
+    # Only Bob
+    bob_commits = get_commits(repo, author="Bob")
+    assert len(bob_commits) == 1
+    assert bob_commits[0].author == "Bob"
+
+
+def test_get_file_stats_with_author_filter(multi_author_repo):
+    repo = multi_author_repo
+    # Alice's file changes
+    alice_changes = get_file_stats(repo, author="Alice")
+    assert all(fc.path == "a.py" for fc in alice_changes)
+
+    # Bob's file changes
+    bob_changes = get_file_stats(repo, author="Bob")
+    assert all(fc.path == "b.py" for fc in bob_changes)
+
+
+def test_get_commits_with_since_filter(shared_repo):
+    # All commits are from right now, so "since 1 hour ago" should get them all
+    commits = get_commits(shared_repo, since="1 hour ago")
+    assert len(commits) == 4
+
+    # "since tomorrow" should get none
+    commits_future = get_commits(shared_repo, since="2099-01-01")
+    assert len(commits_future) == 0
+
+
+def test_scan_repo_with_filters(multi_author_repo):
+    repo = multi_author_repo
+    # Filtered scan — only Alice's work
+    info = scan_repo(repo, author="Alice")
+    assert len(info.commits) == 2
+    assert all(c.author == "Alice" for c in info.commits)
+    # repo_info (total_commits, branch_count) stays unfiltered
+    assert info.total_commits == 3
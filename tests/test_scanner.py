@@ -1,77 +1,89 @@
 """Tests for repo discovery scanner."""
 
 import os
-import tempfile
 
-from huntd.scanner import find_repos
+import pytest
 
+from huntd.scanner import find_repos, find_repos_iter
 
-def test_find_repos_single():
-    with tempfile.TemporaryDirectory() as tmp:
-        os.makedirs(os.path.join(tmp, "project-a", ".git"))
-        repos = find_repos(tmp)
-        assert len(repos) == 1
-        assert repos[0] == os.path.join(tmp, "project-a")
 
+@pytest.fixture
+def make_tree(tmp_path):
+    """Factory: create a fake repo (a bare `.git` dir) at each relative path, return the root."""
+    root = str(tmp_path)
 
-def test_find_repos_multiple():
-    with tempfile.TemporaryDirectory() as tmp:
-        os.makedirs(os.path.join(tmp, "alpha", ".git"))
-        os.makedirs(os.path.join(tmp, "beta", ".git"))
-        os.makedirs(os.path.join(tmp, "gamma", ".git"))
-        repos = find_repos(tmp)
-        assert len(repos) == 3
+    def _make(*repo_paths: str) -> str:
+        for rel in repo_paths:
+            os.makedirs(os.path.join(root, rel, ".git"), exist_ok=True)
+        return root
 
+    return _make
 
-def test_find_repos_nested_not_counted():
+
+@pytest.fixture(scope="session")
+def nested_tree(tmp_path_factory):
+    """A repo with another repo inside it, built once per session. Treat as read-only."""
+    root = tmp_path_factory.mktemp("nested")
+    os.makedirs(root / "parent" / ".git")
+    os.makedirs(root / "parent" / "child" / ".git")
+    return str(root)
+
+
+def test_find_repos_single(make_tree):
+    tmp = make_tree("project-a")
+    repos = find_repos(tmp)
+    assert len(repos) == 1
+    assert repos[0] == os.path.join(tmp, "project-a")
+
+
+def test_find_repos_multiple(make_tree):
+    tmp = make_tree("alpha", "beta", "gamma")
+    repos = find_repos(tmp)
+    assert len(repos) == 3
+
+
+def test_find_repos_nested_not_counted(nested_tree):
     """Repos inside other repos should be skipped (not recursed into)."""
-    with tempfile.TemporaryDirectory() as tmp:
-        os.makedirs(os.path.join(tmp, "parent", ".git"))
-        os.makedirs(os.path.join(tmp, "parent", "child", ".git"))
-        repos = find_repos(tmp)
-        assert len(repos) == 1
-        assert "parent" in repos[0]
-
-
-def test_find_repos_skips_hidden():
-    with tempfile.TemporaryDirectory() as tmp:
-        os.makedirs(os.path.join(tmp, ".hidden-project", ".git"))
-        os.makedirs(os.path.join(tmp, "visible", ".git"))
-        repos = find_repos(tmp)
-        assert len(repos) == 1
-        assert "visible" in repos[0]
-
-
-def test_find_repos_skips_node_modules():
-    with tempfile.TemporaryDirectory() as tmp:
-        os.makedirs(os.path.join(tmp, "node_modules", "dep", ".git"))
-        os.makedirs(os.path.join(tmp, "real-project", ".git"))
-        repos = find_repos(tmp)
-        assert len(repos) == 1
-        assert "real-project" in repos[0]
-
-
-def test_find_repos_empty():
-    with tempfile.TemporaryDirectory() as tmp:
-        repos = find_repos(tmp)
-        assert repos == []
-
-
-def test_find_repos_max_depth():
-    with tempfile.TemporaryDirectory() as tmp:
-        deep = os.path.join(tmp, "a", "b", "c", "d", "e", "f", "g", ".git")
-        os.makedirs(deep)
-        repos = find_repos(tmp, max_depth=3)
-        assert len(repos) == 0
-        repos = find_repos(tmp, max_depth=10)
-        assert len(repos) == 1
-
-
-def test_find_repos_sorted():
-    with tempfile.TemporaryDirectory() as tmp:
-        os.makedirs(os.path.join(tmp, "zebra", ".git"))
-        os.makedirs(os.path.join(tmp, "alpha", ".git"))
-        os.makedirs(os.path.join(tmp, "middle", ".git"))
-        repos = find_repos(tmp)
-        names = [os.path.basename(r) for r in repos]
-        assert names == ["alpha", "middle", "zebra"]
+    repos = find_repos(nested_tree)
+    assert len(repos) == 1
+    assert "parent" in repos[0]
+
+
+@pytest.mark.parametrize("skipped", [
+    ".hidden-project",
+    "node_modules/dep",
+    "venv/dep",
+    "target/dep",
+])
+def test_find_repos_skips(make_tree, skipped):
+    tmp = make_tree(skipped, "real-project")
+    repos = find_repos(tmp)
+    assert repos == [os.path.join(tmp, "real-project")]
+
+
+def test_find_repos_empty(make_tree):
+    tmp = make_tree()
+    repos = find_repos(tmp)
+    assert repos == []
+
+
+def test_find_repos_max_depth(make_tree):
+    tmp = make_tree("a/b/c/d/e/f/g")
+    repos = find_repos(tmp, max_depth=3)
+    assert len(repos) == 0
+    repos = find_repos(tmp, max_depth=10)
+    assert len(repos) == 1
+
+
+def test_find_repos_sorted(make_tree):
+    tmp = make_tree("zebra", "alpha", "middle")
+    repos = find_repos(tmp)
+    names = [os.path.basename(r) for r in repos]
+    assert names == ["alpha", "middle", "zebra"]
+
+
+def test_find_repos_iter_yields_same_repos(make_tree):
+    tmp = make_tree("zebra", "group/alpha", "node_modules/dep")
+    found = list(find_repos_iter(tmp))
+    assert sorted(found) == find_repos(tmp)
+    assert len(found) == 2